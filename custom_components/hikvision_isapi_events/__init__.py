@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 from collections.abc import Callable
-import contextlib
 from dataclasses import dataclass, field
+import heapq
+import itertools
 import logging
+import re
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
@@ -35,6 +38,25 @@ from .storage import HikvisionChannelTimeoutStore
 
 _LOGGER = logging.getLogger(__name__)
 
+_OVERRIDE_RE = re.compile(r"\s*(\d+)\s*=\s*(-?\d+)\s*")
+
+_KNOWN_VALUES = ("active", "inactive", "human", "vehicle")
+_NORMALIZED_VALUES: dict[str, str] = {
+    variant: value
+    for value in _KNOWN_VALUES
+    for variant in (value, value.capitalize(), value.upper())
+}
+
+
+def _normalize(value: str | None) -> str | None:
+    """Lower-case an event field, reusing the canonical string when known."""
+    if not value:
+        return None
+    normalized = _NORMALIZED_VALUES.get(value)
+    if normalized is None:
+        normalized = value.lower()
+    return normalized
+
 
 @dataclass(slots=True)
 class ChannelState:
@@ -48,7 +70,22 @@ class ChannelState:
     last_event_state: str | None = None
     last_target_type: str | None = None
     last_event_type: str | None = None
-    off_timer: asyncio.TimerHandle | None = None
+
+    def reset(self, channel_id: int) -> None:
+        """Reinitialize a pooled state for another channel."""
+        self.channel_id = channel_id
+        self.motion_on = False
+        self.human_on = False
+        self.vehicle_on = False
+        self.last_event_datetime = None
+        self.last_event_state = None
+        self.last_target_type = None
+        self.last_event_type = None
+
+
+# States released by unloaded entries, reused when an entry is set up again.
+_STATE_POOL: list[ChannelState] = []
+_STATE_POOL_MAX = 256
 
 
 class ChannelManager:
@@ -65,12 +102,21 @@ class ChannelManager:
         self.entry = entry
         self._timeout_store = timeout_store
         self._states: dict[int, ChannelState] = {}
-        self._entity_listeners: list[Callable[[int], None]] = []
-        self._channel_listeners: list[Callable[[int], None]] = []
+        self._sorted_ids: list[int] = []
+        self._entity_listeners: dict[int, dict[int, Callable[[], None]]] = {}
+        self._channel_listeners: dict[int, Callable[[int], None]] = {}
+        self._listener_seq = itertools.count()
+        self._pending: list[tuple[float, int, int]] = []
+        self._seq = itertools.count()
+        self._queued: dict[int, tuple[float, int]] = {}
+        self._off_at: dict[int, float] = {}
+        self._wheel_handle: asyncio.TimerHandle | None = None
         self._timeouts = {
             channel_id: self._clamp_timeout(seconds)
             for channel_id, seconds in initial_timeouts.items()
         }
+        self._default_delay = MIN_OFF_DELAY_SECONDS
+        self.refresh_from_entry()
 
     @property
     def dvr_identifier(self) -> tuple[str, str, str]:
@@ -87,135 +133,246 @@ class ChannelManager:
         if state is not None:
             return state
 
-        state = ChannelState(channel_id=channel_id)
+        state = self._new_state(channel_id)
         self._states[channel_id] = state
-        for callback in self._channel_listeners:
-            callback(channel_id)
+        bisect.insort(self._sorted_ids, channel_id)
+        for listener in tuple(self._channel_listeners.values()):
+            listener(channel_id)
         return state
 
+    @staticmethod
+    def _new_state(channel_id: int) -> ChannelState:
+        if _STATE_POOL:
+            state = _STATE_POOL.pop()
+            state.reset(channel_id)
+            return state
+        return ChannelState(channel_id=channel_id)
+
     def channel_ids(self) -> list[int]:
         """Return sorted known channels."""
-        return sorted(self._states)
+        return self._sorted_ids.copy()
 
     def add_channel_listener(self, callback: Callable[[int], None]) -> Callable[[], None]:
         """Listen for newly-created channels."""
-        self._channel_listeners.append(callback)
+        token = next(self._listener_seq)
+        self._channel_listeners[token] = callback
 
         def _remove() -> None:
-            self._channel_listeners.remove(callback)
+            self._channel_listeners.pop(token, None)
 
         return _remove
 
-    def add_state_listener(self, callback: Callable[[int], None]) -> Callable[[], None]:
-        """Listen for channel state updates."""
-        self._entity_listeners.append(callback)
+    def add_channel_state_listener(
+        self, channel_id: int, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for state updates of one channel."""
+        token = next(self._listener_seq)
+        self._entity_listeners.setdefault(channel_id, {})[token] = callback
 
         def _remove() -> None:
-            self._entity_listeners.remove(callback)
+            listeners = self._entity_listeners.get(channel_id)
+            if listeners is None:
+                return
+            listeners.pop(token, None)
+            if not listeners:
+                del self._entity_listeners[channel_id]
 
         return _remove
 
     def _notify_state(self, channel_id: int) -> None:
-        for callback in self._entity_listeners:
-            callback(channel_id)
+        listeners = self._entity_listeners.get(channel_id)
+        if not listeners:
+            return
+        for listener in tuple(listeners.values()):
+            listener()
 
     @staticmethod
     def _clamp_timeout(seconds: int) -> int:
         return max(MIN_OFF_DELAY_SECONDS, min(MAX_OFF_DELAY_SECONDS, int(seconds)))
 
-    def get_channel_timeout(self, channel_id: int) -> int:
-        """Return timeout for one channel, falling back to global default."""
-        default_delay = int(
+    def refresh_from_entry(self) -> None:
+        """Re-read config entry values cached by the manager."""
+        self._default_delay = self._clamp_timeout(
             self.entry.data.get(CONF_DEFAULT_OFF_DELAY_SECONDS, DEFAULT_OFF_DELAY_SECONDS)
         )
-        return self._timeouts.get(channel_id, self._clamp_timeout(default_delay))
+
+    def get_channel_timeout(self, channel_id: int) -> int:
+        """Return timeout for one channel, falling back to global default."""
+        return self._timeouts.get(channel_id, self._default_delay)
 
     async def async_set_channel_timeout(self, channel_id: int, seconds: int) -> None:
-        """Persist timeout and apply immediately."""
+        """Apply timeout immediately and schedule a debounced save."""
         self._timeouts[channel_id] = self._clamp_timeout(seconds)
-        await self._timeout_store.async_save(self._timeouts)
+        self._timeout_store.async_delay_save(self._timeouts)
+
+    def _cancel_wheel(self) -> None:
+        if self._wheel_handle is not None:
+            self._wheel_handle.cancel()
+            self._wheel_handle = None
+
+    def _is_live(self, item: tuple[float, int, int]) -> bool:
+        when, seq, channel_id = item
+        return self._queued.get(channel_id) == (when, seq)
+
+    def _enqueue(self, channel_id: int, when: float) -> None:
+        seq = next(self._seq)
+        self._queued[channel_id] = (when, seq)
+        heapq.heappush(self._pending, (when, seq, channel_id))
+
+    def _ensure_wheel(self) -> None:
+        """Arm the single expiry timer for the earliest pending channel."""
+        pending = self._pending
+        while pending and not self._is_live(pending[0]):
+            heapq.heappop(pending)
+
+        # An armed wheel with nothing left to expire is left to fire as a no-op.
+        if not pending:
+            return
 
-    def _cancel_timer(self, state: ChannelState) -> None:
-        if state.off_timer and not state.off_timer.cancelled():
-            state.off_timer.cancel()
-        state.off_timer = None
+        earliest = pending[0][0]
+        if self._wheel_handle is not None and self._wheel_handle.when() <= earliest:
+            return
 
-    def _timer_expire(self, channel_id: int) -> None:
-        state = self.get_state(channel_id)
-        state.motion_on = False
-        state.human_on = False
-        state.vehicle_on = False
-        state.last_event_state = "inactive"
-        self._cancel_timer(state)
-        self._notify_state(channel_id)
+        self._cancel_wheel()
+        self._wheel_handle = self.hass.loop.call_at(earliest, self._drain)
+
+    def _drain(self) -> None:
+        """Expire every channel whose off deadline has passed."""
+        self._wheel_handle = None
+        now = self.hass.loop.time()
+        pending = self._pending
+        while pending and pending[0][0] <= now:
+            item = heapq.heappop(pending)
+            if not self._is_live(item):
+                continue
+            channel_id = item[2]
+            del self._queued[channel_id]
+
+            off_at = self._off_at[channel_id]
+            if off_at > now:
+                # Re-armed by later "active" events since this entry was queued.
+                self._enqueue(channel_id, off_at)
+                continue
+
+            del self._off_at[channel_id]
+            state = self.get_state(channel_id)
+            state.motion_on = False
+            state.human_on = False
+            state.vehicle_on = False
+            state.last_event_state = "inactive"
+            self._notify_state(channel_id)
+        self._ensure_wheel()
 
     def _schedule_off(self, channel_id: int) -> None:
-        state = self.get_state(channel_id)
-        self._cancel_timer(state)
-
         delay = self.get_channel_timeout(channel_id)
         if delay <= 0:
+            self._clear_off(channel_id)
             return
 
-        state.off_timer = self.hass.loop.call_later(delay, self._timer_expire, channel_id)
+        off_at = self.hass.loop.time() + delay
+        self._off_at[channel_id] = off_at
+        queued = self._queued.get(channel_id)
+        if queued is not None and queued[0] <= off_at:
+            return
+
+        self._enqueue(channel_id, off_at)
+        if len(self._pending) > 4 * len(self._queued) + 64:
+            self._pending = [item for item in self._pending if self._is_live(item)]
+            heapq.heapify(self._pending)
+        self._ensure_wheel()
+
+    def _clear_off(self, channel_id: int) -> None:
+        self._off_at.pop(channel_id, None)
+        self._queued.pop(channel_id, None)
 
     def process_event(self, event: dict) -> None:
         """Process parsed VMD event."""
         if event.get("event_type") != EVENT_TYPE_VMD:
             return
 
-        channel_id = event.get("channel_id")
-        if not isinstance(channel_id, int):
-            return
-
+        channel_id = event["channel_id"]
         state = self.get_state(channel_id)
-        event_state = (event.get("event_state") or "").lower()
-        target_type = (event.get("target_type") or "").lower()
-
-        state.last_event_datetime = event.get("date_time")
-        state.last_event_state = event_state or None
-        state.last_target_type = target_type or None
-        state.last_event_type = event.get("event_type")
+        event_state = _normalize(event.get("event_state"))
+        target_type = _normalize(event.get("target_type"))
+        date_time = event.get("date_time")
 
         if event_state == "active":
-            state.motion_on = True
-            if target_type == "human":
-                state.human_on = True
-            elif target_type == "vehicle":
-                state.vehicle_on = True
+            motion_on = True
+            human_on = state.human_on or target_type == "human"
+            vehicle_on = state.vehicle_on or target_type == "vehicle"
             self._schedule_off(channel_id)
         elif event_state == "inactive":
-            state.motion_on = False
-            state.human_on = False
-            state.vehicle_on = False
-            self._cancel_timer(state)
+            motion_on = human_on = vehicle_on = False
+            self._clear_off(channel_id)
+        else:
+            motion_on = state.motion_on
+            human_on = state.human_on
+            vehicle_on = state.vehicle_on
+
+        if (
+            motion_on == state.motion_on
+            and human_on == state.human_on
+            and vehicle_on == state.vehicle_on
+            and date_time == state.last_event_datetime
+            and event_state == state.last_event_state
+            and target_type == state.last_target_type
+            and state.last_event_type == EVENT_TYPE_VMD
+        ):
+            # Repeated frame: the off deadline is refreshed, nothing to publish.
+            return
+
+        state.motion_on = motion_on
+        state.human_on = human_on
+        state.vehicle_on = vehicle_on
+        state.last_event_datetime = date_time
+        state.last_event_state = event_state
+        state.last_target_type = target_type
+        state.last_event_type = EVENT_TYPE_VMD
 
         self._notify_state(channel_id)
 
     def add_discovered_channels(self, channels: list[int]) -> None:
         """Register discovered channel IDs before events arrive."""
-        for channel_id in channels:
-            self.get_state(channel_id)
+        new_ids = [
+            channel_id for channel_id in dict.fromkeys(channels) if channel_id not in self._states
+        ]
+        if not new_ids:
+            return
+
+        self._states.update({channel_id: self._new_state(channel_id) for channel_id in new_ids})
+        self._sorted_ids = sorted(self._sorted_ids + new_ids)
+        listeners = tuple(self._channel_listeners.values())
+        for channel_id in new_ids:
+            for listener in listeners:
+                listener(channel_id)
+
+    async def async_flush_timeouts(self) -> None:
+        """Persist any timeout change still waiting on the debounced save."""
+        await self._timeout_store.async_flush()
 
     def shutdown(self) -> None:
-        """Cancel all timers."""
-        for state in self._states.values():
-            self._cancel_timer(state)
+        """Cancel all timers and release channel states to the pool."""
+        self._pending.clear()
+        self._queued.clear()
+        self._off_at.clear()
+        self._cancel_wheel()
+
+        room = _STATE_POOL_MAX - len(_STATE_POOL)
+        if room > 0:
+            _STATE_POOL.extend(list(self._states.values())[:room])
+        self._states.clear()
+        self._sorted_ids.clear()
 
 
 def _parse_overrides(raw: str) -> dict[int, int]:
     overrides: dict[int, int] = {}
     for line in raw.splitlines():
-        line = line.strip()
-        if not line or "=" not in line:
+        match = _OVERRIDE_RE.fullmatch(line)
+        if match is None:
             continue
-        left, right = line.split("=", 1)
-        try:
-            channel_id = int(left.strip())
-            seconds = int(right.strip())
-        except ValueError:
-            continue
-        overrides[channel_id] = max(MIN_OFF_DELAY_SECONDS, min(MAX_OFF_DELAY_SECONDS, seconds))
+        overrides[int(match[1])] = max(
+            MIN_OFF_DELAY_SECONDS, min(MAX_OFF_DELAY_SECONDS, int(match[2]))
+        )
     return overrides
 
 
@@ -238,12 +395,11 @@ async def _run_stream(runtime: RuntimeData) -> None:
     reconnect_delay = max(1, reconnect_delay)
     backoff = reconnect_delay
 
-    async def _on_event(event: dict) -> None:
-        runtime.manager.process_event(event)
-
     while not runtime.stop_event.is_set():
         try:
-            await runtime.client.stream_alerts(_on_event, runtime.stop_event)
+            await runtime.client.stream_alerts(
+                runtime.manager.process_event, runtime.stop_event
+            )
             backoff = reconnect_delay
         except asyncio.CancelledError:
             raise
@@ -253,6 +409,12 @@ async def _run_stream(runtime: RuntimeData) -> None:
             backoff = min(backoff * 2, 60)
 
 
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Refresh cached entry values after the config entry changes."""
+    runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id][DATA_RUNTIME]
+    runtime.manager.refresh_from_entry()
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up via YAML (not used)."""
     return True
@@ -315,6 +477,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     runtime.task = hass.async_create_task(_run_stream(runtime))
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_RUNTIME: runtime}
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -328,11 +491,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id][DATA_RUNTIME]
     runtime.stop_event.set()
+    await runtime.manager.async_flush_timeouts()
     runtime.manager.shutdown()
     if runtime.task:
         runtime.task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
+        try:
             await runtime.task
+        except asyncio.CancelledError:
+            pass
 
     hass.data[DOMAIN].pop(entry.entry_id)
     if not hass.data[DOMAIN]:
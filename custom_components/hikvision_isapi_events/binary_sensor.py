@@ -36,7 +36,7 @@ async def async_setup_entry(
             key = (channel_id, sensor_type)
             if key in entities:
                 continue
-            sensor = HikvisionChannelBinarySensor(manager, entry, channel_id, sensor_type)
+            sensor = _SENSOR_CLASSES[sensor_type](manager, entry, channel_id, sensor_type)
             entities[key] = sensor
             new_entities.append(sensor)
         if new_entities:
@@ -52,6 +52,7 @@ class HikvisionChannelBinarySensor(BinarySensorEntity):
     """Event-driven binary sensor per channel/signal type."""
 
     _attr_should_poll = False
+    _pretty: str
 
     def __init__(self, manager, entry: ConfigEntry, channel_id: int, sensor_type: str) -> None:
         self._manager = manager
@@ -59,9 +60,15 @@ class HikvisionChannelBinarySensor(BinarySensorEntity):
         self._channel_id = channel_id
         self._sensor_type = sensor_type
         self._remove_listener = None
+        self._attrs: dict = {
+            ATTR_CHANNEL_ID: channel_id,
+            ATTR_LAST_EVENT_DATETIME: None,
+            ATTR_LAST_EVENT_STATE: None,
+            ATTR_LAST_TARGET_TYPE: None,
+            ATTR_LAST_EVENT_TYPE: None,
+        }
 
-        pretty = sensor_type.capitalize()
-        self._attr_name = f"Hikvision CH{channel_id} {pretty}"
+        self._attr_name = f"Hikvision CH{channel_id} {self._pretty}"
         self._attr_unique_id = f"{entry.entry_id}_ch{channel_id}_{sensor_type}"
         self.entity_id = f"binary_sensor.hikvision_ch{channel_id}_{sensor_type}"
 
@@ -76,40 +83,72 @@ class HikvisionChannelBinarySensor(BinarySensorEntity):
             "via_device": self._manager.dvr_identifier,
         }
 
-    @property
-    def is_on(self) -> bool:
-        """Return the sensor state."""
-        state = self._manager.get_state(self._channel_id)
-        return {
-            "motion": state.motion_on,
-            "human": state.human_on,
-            "vehicle": state.vehicle_on,
-        }[self._sensor_type]
-
     @property
     def extra_state_attributes(self) -> dict:
         """Return attributes for diagnostics."""
+        return self._attrs
+
+    def _refresh_attrs(self) -> None:
         state = self._manager.get_state(self._channel_id)
-        return {
-            ATTR_CHANNEL_ID: self._channel_id,
-            ATTR_LAST_EVENT_DATETIME: state.last_event_datetime,
-            ATTR_LAST_EVENT_STATE: state.last_event_state,
-            ATTR_LAST_TARGET_TYPE: state.last_target_type,
-            ATTR_LAST_EVENT_TYPE: state.last_event_type,
-        }
+        attrs = self._attrs
+        attrs[ATTR_LAST_EVENT_DATETIME] = state.last_event_datetime
+        attrs[ATTR_LAST_EVENT_STATE] = state.last_event_state
+        attrs[ATTR_LAST_TARGET_TYPE] = state.last_target_type
+        attrs[ATTR_LAST_EVENT_TYPE] = state.last_event_type
+
+    def _handle_state_update(self) -> None:
+        self._refresh_attrs()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to channel state changes."""
-
-        def _update(channel_id: int) -> None:
-            if channel_id != self._channel_id:
-                return
-            self.async_write_ha_state()
-
-        self._remove_listener = self._manager.add_state_listener(_update)
+        self._refresh_attrs()
+        self._remove_listener = self._manager.add_channel_state_listener(
+            self._channel_id, self._handle_state_update
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from manager."""
         if self._remove_listener:
             self._remove_listener()
             self._remove_listener = None
+
+
+class _MotionSensor(HikvisionChannelBinarySensor):
+    """Motion binary sensor."""
+
+    _pretty = "Motion"
+
+    @property
+    def is_on(self) -> bool:
+        """Return the sensor state."""
+        return self._manager.get_state(self._channel_id).motion_on
+
+
+class _HumanSensor(HikvisionChannelBinarySensor):
+    """Human-target binary sensor."""
+
+    _pretty = "Human"
+
+    @property
+    def is_on(self) -> bool:
+        """Return the sensor state."""
+        return self._manager.get_state(self._channel_id).human_on
+
+
+class _VehicleSensor(HikvisionChannelBinarySensor):
+    """Vehicle-target binary sensor."""
+
+    _pretty = "Vehicle"
+
+    @property
+    def is_on(self) -> bool:
+        """Return the sensor state."""
+        return self._manager.get_state(self._channel_id).vehicle_on
+
+
+_SENSOR_CLASSES: dict[str, type[HikvisionChannelBinarySensor]] = {
+    "motion": _MotionSensor,
+    "human": _HumanSensor,
+    "vehicle": _VehicleSensor,
+}
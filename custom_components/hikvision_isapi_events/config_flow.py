@@ -24,6 +24,24 @@ from .const import (
 )
 from .isapi_client import HikvisionIsapiClient
 
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Required(CONF_USE_SSL, default=DEFAULT_USE_SSL): bool,
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+        vol.Required(
+            CONF_DEFAULT_OFF_DELAY_SECONDS,
+            default=DEFAULT_OFF_DELAY_SECONDS,
+        ): vol.All(int, vol.Range(min=MIN_OFF_DELAY_SECONDS, max=MAX_OFF_DELAY_SECONDS)),
+        vol.Required(
+            CONF_RECONNECT_DELAY_SECONDS,
+            default=DEFAULT_RECONNECT_DELAY_SECONDS,
+        ): vol.All(int, vol.Range(min=1, max=300)),
+    }
+)
+
 
 class HikvisionIsapiEventsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Hikvision ISAPI Events."""
@@ -69,23 +87,7 @@ class HikvisionIsapiEventsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
-                    vol.Required(CONF_USE_SSL, default=DEFAULT_USE_SSL): bool,
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                    vol.Required(
-                        CONF_DEFAULT_OFF_DELAY_SECONDS,
-                        default=DEFAULT_OFF_DELAY_SECONDS,
-                    ): vol.All(int, vol.Range(min=MIN_OFF_DELAY_SECONDS, max=MAX_OFF_DELAY_SECONDS)),
-                    vol.Required(
-                        CONF_RECONNECT_DELAY_SECONDS,
-                        default=DEFAULT_RECONNECT_DELAY_SECONDS,
-                    ): vol.All(int, vol.Range(min=1, max=300)),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
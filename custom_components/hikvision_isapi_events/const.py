@@ -15,6 +15,8 @@ DEFAULT_USE_SSL = False
 DEFAULT_OFF_DELAY_SECONDS = 30
 DEFAULT_RECONNECT_DELAY_SECONDS = 5
 
+TIMEOUT_SAVE_DELAY_SECONDS = 1.0
+
 MIN_OFF_DELAY_SECONDS = 0
 MAX_OFF_DELAY_SECONDS = 1800
 
@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 import hashlib
 import logging
 import os
-import random
 import re
 from typing import Any
 
 import aiohttp
 
+from homeassistant.util.ssl import client_context
+
 from .const import ALERT_STREAM_PATH, DEVICE_INFO_PATH
-from .parsing import AlertStreamParser, parse_event_notification
+from .parsing import AlertStreamParser
 
 _LOGGER = logging.getLogger(__name__)
 
-_DIGEST_PAIR_RE = re.compile(r"(\w+)=(?:\"([^\"]*)\"|([^,]+))")
+_MAX_NONCE_COUNT = 0xFFFFFFFF
+
+_DIGEST_PAIR_RE = re.compile(r'(\w+)\s*=\s*(?:"([^"]*)"|([^,\s]+))', re.ASCII)
 
 
 class DigestAuthState:
@@ -28,6 +31,8 @@ class DigestAuthState:
         self._password = password
         self._challenge: dict[str, str] = {}
         self._nc = 0
+        self._ha1: str | None = None
+        self._ha1_realm: str | None = None
 
     def update_from_header(self, header: str | None) -> None:
         """Parse WWW-Authenticate digest challenge."""
@@ -36,13 +41,16 @@ class DigestAuthState:
 
         payload = header.split(" ", 1)[1] if " " in header else header
         challenge: dict[str, str] = {}
-        for match in _DIGEST_PAIR_RE.finditer(payload):
-            key = match.group(1)
-            value = match.group(2) if match.group(2) is not None else match.group(3)
-            challenge[key.lower()] = value.strip()
+        for key, quoted, bare in _DIGEST_PAIR_RE.findall(payload):
+            challenge[key.lower()] = quoted or bare
         if "realm" in challenge and "nonce" in challenge:
+            if challenge == self._challenge:
+                return
+            if challenge["nonce"] != self._challenge.get("nonce"):
+                self._nc = 0
             self._challenge = challenge
-            self._nc = 0
+            if challenge["realm"] != self._ha1_realm:
+                self._ha1 = None
 
     def build_authorization(self, method: str, uri: str) -> str | None:
         """Build digest Authorization header from current challenge."""
@@ -58,12 +66,22 @@ class DigestAuthState:
         if algorithm.upper() != "MD5":
             _LOGGER.debug("Unsupported digest algorithm %s, forcing MD5", algorithm)
 
+        if self._nc >= _MAX_NONCE_COUNT:
+            # nc cannot grow past 8 hex digits; drop the nonce and let the
+            # next 401 supply a fresh challenge.
+            self._challenge = {}
+            return None
+
         self._nc += 1
         nc_value = f"{self._nc:08x}"
-        cnonce = hashlib.md5(os.urandom(16) + str(random.random()).encode(), usedforsecurity=False).hexdigest()[:16]  # noqa: S324
+        cnonce = os.urandom(8).hex()
 
-        ha1_raw = f"{self._username}:{realm}:{self._password}"
-        ha1 = hashlib.md5(ha1_raw.encode(), usedforsecurity=False).hexdigest()  # noqa: S324
+        ha1 = self._ha1
+        if ha1 is None:
+            ha1_raw = f"{self._username}:{realm}:{self._password}"
+            ha1 = hashlib.md5(ha1_raw.encode(), usedforsecurity=False).hexdigest()  # noqa: S324
+            self._ha1 = ha1
+            self._ha1_realm = realm
 
         ha2_raw = f"{method}:{uri}"
         ha2 = hashlib.md5(ha2_raw.encode(), usedforsecurity=False).hexdigest()  # noqa: S324
@@ -89,7 +107,11 @@ class DigestAuthState:
 
 
 class HikvisionIsapiClient:
-    """Client for non-blocking HTTP Digest calls and event streaming."""
+    """Client for non-blocking HTTP Digest calls and event streaming.
+
+    The client never opens or closes its own session; it borrows the shared
+    Home Assistant session so connections are pooled and kept alive.
+    """
 
     def __init__(
         self,
@@ -102,15 +124,16 @@ class HikvisionIsapiClient:
     ) -> None:
         self._session = session
         self._scheme = "https" if use_ssl else "http"
-        self._use_ssl = use_ssl
+        self._ssl_context = client_context() if use_ssl else False
         self._host = host
         self._port = port
         self._digest = DigestAuthState(username, password)
+        self._base_url = f"{self._scheme}://{self._host}:{self._port}"
 
     @property
     def base_url(self) -> str:
         """Base URL for requests."""
-        return f"{self._scheme}://{self._host}:{self._port}"
+        return self._base_url
 
     async def _request(
         self,
@@ -127,10 +150,10 @@ class HikvisionIsapiClient:
 
         response = await self._session.request(
             method,
-            f"{self.base_url}{path}",
+            self._base_url + path,
             headers=headers,
             timeout=timeout,
-            ssl=self._use_ssl,
+            ssl=self._ssl_context,
         )
 
         if response.status != 401:
@@ -149,10 +172,10 @@ class HikvisionIsapiClient:
 
         return await self._session.request(
             method,
-            f"{self.base_url}{path}",
+            self._base_url + path,
             headers=retry_headers,
             timeout=timeout,
-            ssl=self._use_ssl,
+            ssl=self._ssl_context,
         )
 
     async def fetch_text(self, path: str) -> tuple[int, str]:
@@ -161,19 +184,36 @@ class HikvisionIsapiClient:
         async with await self._request("GET", path, timeout=timeout) as response:
             return response.status, await response.text()
 
+    async def _fetch_status(self, method: str, path: str) -> int:
+        timeout = aiohttp.ClientTimeout(total=15)
+        async with await self._request(method, path, timeout=timeout) as response:
+            await response.release()
+            return response.status
+
+    async def head(self, path: str) -> int:
+        """Issue a HEAD request and return the response status."""
+        return await self._fetch_status("HEAD", path)
+
     async def validate_device_info(self) -> bool:
         """Validate access by calling /ISAPI/System/deviceInfo."""
-        status, _body = await self.fetch_text(DEVICE_INFO_PATH)
+        status = await self.head(DEVICE_INFO_PATH)
+        if status not in (200, 401):
+            # Firmwares without HEAD support answer 400/403/404/405/501;
+            # confirm with a GET whose body is released unread.
+            status = await self._fetch_status("GET", DEVICE_INFO_PATH)
         return status == 200
 
     async def stream_alerts(
         self,
-        callback: Callable[[dict[str, Any]], Awaitable[None]],
+        callback: Callable[[dict[str, Any]], None],
         stop_event,
         *,
         timeout_seconds: int = 90,
     ) -> None:
-        """Connect to alertStream and invoke callback for each parsed event."""
+        """Connect to alertStream and invoke callback for each parsed event.
+
+        Only events carrying an integer ``channel_id`` are delivered.
+        """
         timeout = aiohttp.ClientTimeout(total=None, sock_read=timeout_seconds)
 
         async with await self._request("GET", ALERT_STREAM_PATH, timeout=timeout) as response:
@@ -187,7 +227,6 @@ class HikvisionIsapiClient:
                     return
                 if not chunk:
                     continue
-                for xml_doc in parser.feed(chunk):
-                    event = parse_event_notification(xml_doc)
-                    if event is not None:
-                        await callback(event)
+                for event in parser.feed(chunk):
+                    if event["channel_id"] is not None:
+                        callback(event)
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+import functools
+import io
+from xml.parsers import expat
 import xml.etree.ElementTree as ET
 
+_ALERT_ROOT = "EventNotificationAlert"
+_ALERT_FIELDS = frozenset({"channelID", "eventType", "eventState", "targetType", "dateTime"})
 
+
+@functools.lru_cache(maxsize=512)
 def local_name(tag: str) -> str:
     """Return tag name without XML namespace."""
     if "}" in tag:
@@ -13,95 +21,147 @@ def local_name(tag: str) -> str:
     return tag
 
 
-def first_text(root: ET.Element, tag_name: str) -> str | None:
-    """Find first text value for a tag (namespace agnostic)."""
-    for elem in root.iter():
-        if local_name(elem.tag) == tag_name:
-            text = elem.text.strip() if elem.text else ""
-            return text or None
-    return None
-
-
-def parse_event_notification(xml_payload: str) -> dict[str, str | int | None] | None:
-    """Parse EventNotificationAlert payload into a dictionary."""
-    try:
-        root = ET.fromstring(xml_payload)
-    except ET.ParseError:
-        return None
-
-    if local_name(root.tag) != "EventNotificationAlert":
-        return None
-
-    channel_text = first_text(root, "channelID")
+def _build_event(found: dict[str, str | None]) -> dict[str, str | int | None]:
+    channel_text = found.get("channelID")
     channel_id: int | None = None
-    if channel_text is not None:
-        try:
-            channel_id = int(channel_text)
-        except ValueError:
-            channel_id = None
+    if channel_text is not None and channel_text.isdecimal():
+        channel_id = int(channel_text)
 
     return {
-        "event_type": first_text(root, "eventType"),
-        "event_state": first_text(root, "eventState"),
+        "event_type": found.get("eventType"),
+        "event_state": found.get("eventState"),
         "channel_id": channel_id,
-        "target_type": first_text(root, "targetType"),
-        "date_time": first_text(root, "dateTime"),
+        "target_type": found.get("targetType"),
+        "date_time": found.get("dateTime"),
     }
 
 
 def parse_channel_ids(xml_payload: str) -> list[int]:
     """Parse channel IDs from a discovery response body."""
+    found: set[int] = set()
     try:
-        root = ET.fromstring(xml_payload)
+        for _event, elem in ET.iterparse(io.BytesIO(xml_payload.encode()), events=("end",)):
+            if elem.text and local_name(elem.tag) in {"channelID", "id"}:
+                value = elem.text.strip()
+                if value.isdecimal():
+                    found.add(int(value))
+            elem.clear()
     except ET.ParseError:
         return []
 
-    found: set[int] = set()
-    for elem in root.iter():
-        name = local_name(elem.tag)
-        if name not in {"channelID", "id"}:
-            continue
-        if not elem.text:
-            continue
-        value = elem.text.strip()
-        if not value:
-            continue
-        try:
-            found.add(int(value))
-        except ValueError:
-            continue
-
     return sorted(found)
 
 
 @dataclass(slots=True)
 class AlertStreamParser:
-    """Incremental parser extracting EventNotificationAlert XML blocks."""
-
-    buffer: str = ""
-    _start_token: str = field(init=False, default="<EventNotificationAlert")
-    _end_token: str = field(init=False, default="</EventNotificationAlert>")
-
-    def feed(self, chunk: bytes) -> list[str]:
-        """Feed raw bytes and return extracted XML documents."""
-        self.buffer += chunk.decode("utf-8", errors="ignore")
-        docs: list[str] = []
+    """Incremental parser turning alertStream bytes into event dictionaries.
+
+    Each EventNotificationAlert block is handed to one long-lived expat
+    parser, whose callbacks collect the wanted fields directly; no element
+    tree is built.
+    """
+
+    buffer: bytearray = field(default_factory=bytearray)
+    _start_token: bytes = field(init=False, default=b"<EventNotificationAlert")
+    _end_token: bytes = field(init=False, default=b"</EventNotificationAlert>")
+    _root: str | None = field(init=False, default=None)
+    _found: dict[str, str | None] = field(init=False, default_factory=dict)
+    _field: str | None = field(init=False, default=None)
+    _text: list[str] = field(init=False, default_factory=list)
+    _scan_from: int = field(init=False, default=0)
+    _parser: expat.XMLParserType | None = field(init=False, default=None)
+    _depth: int = field(init=False, default=0)
+
+    def feed(self, chunk: bytes) -> Iterator[dict[str, str | int | None]]:
+        """Feed raw bytes and yield parsed EventNotificationAlert events."""
+        buffer = self.buffer
+        buffer.extend(chunk)
 
         while True:
-            start = self.buffer.find(self._start_token)
+            start = buffer.find(self._start_token, self._scan_from)
             if start < 0:
-                if len(self.buffer) > 65536:
-                    self.buffer = self.buffer[-32768:]
+                if len(buffer) > 65536:
+                    del buffer[:-32768]
+                # Resume after the bytes already scanned, keeping room for a
+                # start token split across chunks.
+                self._scan_from = max(0, len(buffer) - len(self._start_token) + 1)
                 break
 
-            end = self.buffer.find(self._end_token, start)
+            end = buffer.find(self._end_token, start)
             if end < 0:
                 if start > 0:
-                    self.buffer = self.buffer[start:]
+                    del buffer[:start]
+                self._scan_from = 0
                 break
 
             end += len(self._end_token)
-            docs.append(self.buffer[start:end])
-            self.buffer = self.buffer[end:]
-
-        return docs
+            event = self._parse(buffer[start:end])
+            del buffer[:end]
+            self._scan_from = 0
+            if event is not None:
+                yield event
+
+    def _create_parser(self) -> expat.XMLParserType:
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+        # Alert blocks are fed as children of one synthetic root element so
+        # the same parser can be reused for the whole stream.
+        self._depth = -1
+        parser.Parse(b"<stream>", False)
+        return parser
+
+    def _parse(self, xml_doc: bytes | bytearray | str) -> dict[str, str | int | None] | None:
+        parser = self._parser
+        if parser is None:
+            parser = self._parser = self._create_parser()
+
+        self._root = None
+        self._found = {}
+        self._field = None
+        self._text.clear()
+        try:
+            parser.Parse(xml_doc, False)
+        except expat.ExpatError:
+            self._parser = None
+            if isinstance(xml_doc, str):
+                return None
+            # Some firmwares emit invalid UTF-8 in free-text fields.
+            return self._parse(bytes(xml_doc).decode("utf-8", errors="ignore"))
+
+        if self._depth != 0:
+            # Unbalanced block; start over rather than nest the next one in it.
+            self._parser = None
+            return None
+        if self._root != _ALERT_ROOT:
+            return None
+        return _build_event(self._found)
+
+    def _start_element(self, name: str, _attrs: dict[str, str]) -> None:
+        self._depth += 1
+        if self._depth == 0:
+            return
+        name = local_name(name)
+        if self._depth == 1:
+            self._root = name
+        if self._field is not None:
+            self._finish_field()
+        if name in _ALERT_FIELDS and name not in self._found:
+            self._field = name
+
+    def _end_element(self, _name: str) -> None:
+        if self._field is not None:
+            self._finish_field()
+        self._depth -= 1
+
+    def _character_data(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+
+    def _finish_field(self) -> None:
+        text = "".join(self._text).strip()
+        self._found[self._field] = text or None
+        self._field = None
+        self._text.clear()
@@ -5,7 +5,7 @@ from __future__ import annotations
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_VERSION
+from .const import STORAGE_VERSION, TIMEOUT_SAVE_DELAY_SECONDS
 
 
 class HikvisionChannelTimeoutStore:
@@ -17,6 +17,7 @@ class HikvisionChannelTimeoutStore:
             STORAGE_VERSION,
             f"hikvision_isapi_events.{entry_id}",
         )
+        self._pending: dict[int, int] | None = None
 
     async def async_load(self) -> dict[int, int]:
         """Load persisted channel timeout values."""
@@ -27,19 +28,42 @@ class HikvisionChannelTimeoutStore:
 
         parsed: dict[int, int] = {}
         for channel, value in raw_timeouts.items():
+            if not channel.isdecimal():
+                continue
             try:
                 parsed[int(channel)] = int(value)
             except (TypeError, ValueError):
                 continue
         return parsed
 
+    @staticmethod
+    def _serialize(channel_timeouts: dict[int, int]) -> dict:
+        return {
+            "channel_timeouts": {
+                str(channel_id): int(seconds) for channel_id, seconds in channel_timeouts.items()
+            }
+        }
+
     async def async_save(self, channel_timeouts: dict[int, int]) -> None:
         """Save channel timeout values."""
-        await self._store.async_save(
-            {
-                "channel_timeouts": {
-                    str(channel_id): int(seconds)
-                    for channel_id, seconds in channel_timeouts.items()
-                }
-            }
-        )
+        self._pending = None
+        await self._store.async_save(self._serialize(channel_timeouts))
+
+    def async_delay_save(self, channel_timeouts: dict[int, int]) -> None:
+        """Save channel timeout values once updates settle.
+
+        The mapping is read when the write happens, so callers may keep
+        mutating it; pending data is flushed when Home Assistant stops.
+        """
+        self._pending = channel_timeouts
+        self._store.async_delay_save(self._write_pending, TIMEOUT_SAVE_DELAY_SECONDS)
+
+    def _write_pending(self) -> dict:
+        channel_timeouts = self._pending or {}
+        self._pending = None
+        return self._serialize(channel_timeouts)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, replacing the scheduled write."""
+        if self._pending is not None:
+            await self.async_save(self._pending)